@@ -4,23 +4,306 @@ Simple Defense News Scraper - ERROR FREE VERSION
 Just extracts articles with links, full text, and dates
 """
 
-import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+import lxml.html
 import feedparser
+import ahocorasick
 import schedule
 import time
 import argparse
 from datetime import datetime, timedelta
-import json
+from dateutil.parser import isoparse
+from email.utils import parsedate_to_datetime
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+# Feed fetching is network-bound, so threads overlap the waits
+FEED_WORKERS = 16
+ARTICLE_WORKERS = 32
+
+# (connect, read) seconds; dead hosts fail on the short connect timeout
+REQUEST_TIMEOUT = (3.05, 15)
+
+# On-disk HTTP cache shared across runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'defspace')
+
+# Feeds are revalidated on every fetch (an unchanged feed costs a bodiless 304),
+# while published article pages rarely change
+FEED_EXPIRE_AFTER = requests_cache.EXPIRE_IMMEDIATELY
+ARTICLE_EXPIRE_AFTER = timedelta(days=7)
+
+# Extracted article texts kept in memory; a few weeks of articles at most
+ARTICLE_CACHE_SIZE = 1024
+
+# Text cleanup patterns, compiled once instead of on every article
+_MULTI_NEWLINE = re.compile(r'\n+')
+_MULTI_SPACE = re.compile(r' +')
+# Applied in order: the Share pattern must only see text the first one left, or it
+# reaches back past "Read more"/"Subscribe" and deletes the sentence before them
+_UNWANTED_TEXT = (
+    re.compile(r'(?:Advertisement|Subscribe|Read More|Continue Reading).*', re.IGNORECASE),
+    re.compile(r'Share.*?(?:Facebook|Twitter|LinkedIn).*', re.IGNORECASE),
+    re.compile(r'(?:Follow us on|Also Read:|Related:).*', re.IGNORECASE),
+)
+_TITLE_PUNCT = re.compile(r'[^\w\s]')
+
+# Lifestyle/sports headlines that trip generic keywords like "launch" or "test"
+_OFF_TOPIC_TITLE = re.compile(
+    r'\b(?:horoscopes?|zodiac|recipes?|cricket scores?|live score|box office|lottery results?)\b',
+    re.IGNORECASE
+)
+
+# Query parameters that only track the referrer, ignored when comparing URLs
+_TRACKING_PARAMS = frozenset(('fbclid', 'gclid', 'ocid', 'cmpid', 'ref'))
+
+# Page furniture stripped before extracting article text
+_JUNK_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside', 'advertisement')
+
+# Likely main-content containers; the first match in document order wins
+_CONTENT_TAGS = ('article', 'main')
+_CONTENT_CLASSES = (
+    'article-content', 'post-content', 'entry-content', 'content',
+    'main', 'story', 'article-body'
+)
+_CONTENT_XPATH = etree.XPath('(' + ' | '.join(
+    [f'//{tag}' for tag in _CONTENT_TAGS] +
+    [f'//*[contains(concat(" ", normalize-space(@class), " "), " {cls} ")]'
+     for cls in _CONTENT_CLASSES]
+) + ')[1]')
+
+# Ad containers, matched on whole class names so "header" or "shadow" are kept
+_AD_CLASSES = ('ad', 'ads', 'advertisement')
+_AD_XPATH = etree.XPath('//*[' + ' or '.join(
+    f'contains(concat(" ", normalize-space(@class), " "), " {cls} ")' for cls in _AD_CLASSES
+) + ']')
+
+def _parse_html(response):
+    """Parse an HTML response body into an lxml document"""
+    # A charset in the Content-Type header wins; otherwise lxml uses <meta> or guesses
+    encoding = None
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        encoding = response.encoding
+    try:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+    except LookupError:
+        parser = lxml.html.HTMLParser()
+    return lxml.html.document_fromstring(response.content, parser=parser)
+
+def _is_cacheable(response):
+    """Cache only HTML pages and feeds, so other bodies are never read just to be stored"""
+    content_type = response.headers.get('Content-Type', '').lower()
+    return not content_type or 'html' in content_type or 'xml' in content_type
+
+def _blank_out(element):
+    """Empty an element in place, leaving its tail as a separate text node"""
+    # Removing it would merge the tail into the preceding text and glue the words together
+    element.clear(keep_tail=True)
+    element.tag = 'br'
+
+def _element_text(element):
+    """Join the stripped text nodes under an element, one per line"""
+    return '\n'.join(text.strip() for text in element.itertext() if text.strip())
+
+# Markdown block for one article in the report
+_ARTICLE_TEMPLATE = """### {i}. {title}
+
+**Date:** {date}
+**Link:** {url}
+**Source:** {source}
+
+**Full Article Text:**
+{content}
+
+---
+
+"""
+
+@lru_cache(maxsize=2048)
+def _format_date_string(date_string):
+    """Format a date string as 'DD Month YYYY', or return None if it can't be parsed"""
+    # ISO 8601 covers most feeds; isoparse is far cheaper than trying strptime formats
+    try:
+        return isoparse(date_string).strftime("%d %B %Y")
+    except ValueError:
+        pass
+    
+    for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S"]:
+        try:
+            return datetime.strptime(date_string, fmt).strftime("%d %B %Y")
+        except ValueError:
+            continue
+    return None
+
+def _canonical_url(url):
+    """Normalise a URL for duplicate detection, dropping tracking parameters and fragments"""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not k.lower().startswith('utm_') and k.lower() not in _TRACKING_PARAMS]
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'),
+        urlencode(query), ''
+    ))
+
+class _LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry beyond maxsize"""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+class _FeedDict(dict):
+    """Dict with attribute access, standing in for feedparser's FeedParserDict"""
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+def _feed_date(text):
+    """Parse an RFC 822 or ISO 8601 feed date into a UTC struct_time, or None"""
+    if not text:
+        return None
+    try:
+        return parsedate_to_datetime(text).utctimetuple()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return isoparse(text).utctimetuple()
+    except ValueError:
+        return None
+
+# Feed vocabularies read by the lxml parser; media:, itunes: and the like are ignored
+_ATOM_NS = '{http://www.w3.org/2005/Atom}'
+_RSS1_NS = '{http://purl.org/rss/1.0/}'
+_DC_NS = '{http://purl.org/dc/elements/1.1/}'
+_CONTENT_NS = '{http://purl.org/rss/1.0/modules/content/}'
+_FEED_ITEM_TAGS = ('item', _RSS1_NS + 'item', _ATOM_NS + 'entry')
+_FEED_TITLE_TAGS = ('title', _RSS1_NS + 'title', _ATOM_NS + 'title')
+_FEED_LINK_TAGS = ('link', _RSS1_NS + 'link', _ATOM_NS + 'link')
+_FEED_SUMMARY_TAGS = (
+    'description', _RSS1_NS + 'description', _CONTENT_NS + 'encoded',
+    _ATOM_NS + 'summary', _ATOM_NS + 'content'
+)
+_FEED_DATE_TAGS = ('pubDate', _ATOM_NS + 'published', _DC_NS + 'date')
+
+def _feed_text(item, tags):
+    """Return the text of the first of the given child elements that has any, or None"""
+    for tag in tags:
+        element = item.find(tag)
+        if element is not None:
+            # itertext also covers Atom type="xhtml" content wrapped in a <div>
+            text = ''.join(element.itertext()).strip()
+            if text:
+                return text
+    return None
+
+def _absolute_link(element, url):
+    """Resolve a feed link against any xml:base in scope, as feedparser does"""
+    return urljoin(element.base, url) if element.base else url
+
+def _feed_link(item):
+    """Return an item's article link from RSS <link>, Atom <link href> or a permalink <guid>"""
+    for link in item.iterchildren(*_FEED_LINK_TAGS):
+        if link.text and link.text.strip():
+            return _absolute_link(link, link.text.strip())
+        if link.get('href') and link.get('rel', 'alternate') == 'alternate':
+            return _absolute_link(link, link.get('href'))
+    guid = item.find('guid')
+    if guid is not None and guid.text and guid.get('isPermaLink', 'true') == 'true':
+        return _absolute_link(guid, guid.text.strip())
+    return None
+
+def _parse_feed_lxml(body):
+    """Parse RSS/Atom items with lxml into feedparser-like entries, or None if none are found"""
+    # Strict parse: recovering from bad markup silently truncates text, so leave that to feedparser
+    root = etree.fromstring(body, parser=etree.XMLParser(resolve_entities=False))
+    
+    entries = []
+    for item in root.iter(*_FEED_ITEM_TAGS):
+        entries.append(_FeedDict(
+            title=_feed_text(item, _FEED_TITLE_TAGS),
+            link=_feed_link(item),
+            summary=_feed_text(item, _FEED_SUMMARY_TAGS) or '',
+            published_parsed=_feed_date(_feed_text(item, _FEED_DATE_TAGS)),
+        ))
+    return _FeedDict(entries=entries) if entries else None
+
+def _parse_feed(body):
+    """Parse an RSS/Atom body with lxml, falling back to feedparser for anything unusual"""
+    try:
+        feed = _parse_feed_lxml(body)
+        if feed is not None:
+            return feed
+    except (etree.XMLSyntaxError, ValueError):
+        pass
+    
+    # Entry HTML is only keyword-matched, never rendered, so sanitizing it is wasted work
+    return feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False)
+
+def _build_automaton(words):
+    """Build an Aho-Corasick automaton mapping each (word, value) pair"""
+    automaton = ahocorasick.Automaton()
+    for word, value in words:
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
 
 class SimpleNewsScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache_dir=CACHE_DIR):
+        # Cache responses on disk and revalidate them with ETag/Last-Modified
+        os.makedirs(cache_dir, exist_ok=True)
+        self.session = requests_cache.CachedSession(
+            os.path.join(cache_dir, 'http_cache'),
+            expire_after=ARTICLE_EXPIRE_AFTER,
+            cache_control=True,
+            stale_if_error=True,
+            filter_fn=_is_cacheable
+        )
+        
+        # Extracted article text, reused while the cached page is unchanged
+        self._article_cache = _LRUCache(ARTICLE_CACHE_SIZE)
+        
+        # Parsed feeds, reused when the server answers a revalidation with 304
+        self._feed_cache = {}
+        
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
+        # Reuse connections across feeds/articles and retry transient failures
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # UPDATED - Enhanced news sources with VERIFIED working RSS feeds
         self.sources = {
             "Defense News": [
@@ -127,42 +410,93 @@ class SimpleNewsScraper:
         ]
         
         self.keywords = self.defense_keywords + self.space_keywords
+        self._space_keywords = tuple(self.space_keywords)
+        
+        # Higher priority for space content
+        self.space_priority_keywords = [
+            "isro", "indian space", "space mission", "satellite launch", "rocket",
+            "skyroot", "agnikul", "pixxel", "private space", "space startup",
+            "chandrayaan", "gaganyaan", "mangalyaan", "space policy"
+        ]
+        
+        self.defense_priority_keywords = [
+            "hal", "drdo", "defense contract", "indigenous", "atmanirbhar",
+            "tejas", "brahmos", "private defense", "defense startup"
+        ]
+        
+        # UPDATED - Key companies to track
+        self.defense_companies = [
+            "HAL", "Hindustan Aeronautics", "DRDO", "BEL", "Bharat Electronics",
+            "BHEL", "Bharat Heavy Electricals", "Tata Advanced Systems",
+            "TASL", "L&T", "Larsen & Toubro", "Mahindra Defense", "Kalyani Group", 
+            "Bharat Forge", "Reliance Defence", "Adani Defence", "Godrej Aerospace",
+            "Bharat Dynamics", "BDL", "Ordnance Factory", "GRSE", "MDL", "CSL",
+            "Alpha Design Technologies", "Dynamatic Technologies", "Zen Technologies",
+            "Solar Industries", "Premier Explosives"
+        ]
+        
+        self.space_companies = [
+            "ISRO", "Indian Space Research Organisation", "Skyroot", "Skyroot Aerospace",
+            "Agnikul", "Agnikul Cosmos", "Pixxel", "Bellatrix", "Bellatrix Aerospace",
+            "Dhruva Space", "Astrome", "Astrome Technologies", "Antrix", "NSIL",
+            "NewSpace India", "Kawa Space", "Satellogic India", "Momentus India",
+            "Digantara", "GalaxEye", "SatSure", "Spire Global India"
+        ]
+        
+        # Company names map to (category, display name) so one pass finds every mention
+        self._company_automaton = _build_automaton(
+            [(c.lower(), ('defense', c)) for c in self.defense_companies] +
+            [(c.lower(), ('space', c)) for c in self.space_companies]
+        )
+        
+        # One automaton over all relevance keywords, so each article is scanned once
+        self._keyword_automaton = _build_automaton(
+            (keyword, keyword) for keyword in
+            self.space_priority_keywords + self.defense_priority_keywords + self.keywords
+        )
     
     def extract_full_article(self, url):
         """Extract full article text from URL"""
         try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code != 200:
-                return "Could not fetch article content"
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                if response.status_code != 200:
+                    return "Could not fetch article content"
+                
+                # PDFs, images and the like: stop before the body is downloaded
+                content_type = response.headers.get('Content-Type', '').lower()
+                if content_type and 'html' not in content_type:
+                    return f"Article is not an HTML page ({content_type.split(';')[0]})"
+                
+                # Page unchanged since the last extraction, skip the parse
+                if response.from_cache:
+                    cached = self._article_cache.get(url)
+                    if cached is not None:
+                        return cached
+                
+                # The cache has already read HTML bodies in full to store them
+                tree = _parse_html(response)
             
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 
-                               'aside', 'advertisement', '.ad', '.ads']):
-                element.decompose()
+            # Remove unwanted elements, keeping any text that follows them
+            for element in list(tree.iter(*_JUNK_TAGS)):
+                _blank_out(element)
+            for element in _AD_XPATH(tree):
+                _blank_out(element)
             
             # Try to find main content
-            content_selectors = [
-                'article', '.article-content', '.post-content', '.entry-content',
-                '.content', 'main', '.main', '.story', '.article-body'
-            ]
-            
             content = ""
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    content = content_elem.get_text(separator='\n', strip=True)
-                    break
+            matches = _CONTENT_XPATH(tree)
+            if matches:
+                content = _element_text(matches[0])
             
             if not content:
                 # Fallback to body content
-                body = soup.find('body')
-                if body:
-                    content = body.get_text(separator='\n', strip=True)
+                body = tree.find('body')
+                if body is not None:
+                    content = _element_text(body)
             
             # Clean up the text
             content = self.clean_text(content)
+            self._article_cache.put(url, content)
             return content
             
         except Exception as e:
@@ -171,49 +505,27 @@ class SimpleNewsScraper:
     def clean_text(self, text):
         """Clean and format text"""
         # Remove extra whitespace
-        text = re.sub(r'\n+', '\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = _MULTI_NEWLINE.sub('\n', text)
+        text = _MULTI_SPACE.sub(' ', text)
         
         # Remove common unwanted patterns
-        unwanted_patterns = [
-            r'(Advertisement|Subscribe|Read More|Continue Reading).*',
-            r'Share.*?(Facebook|Twitter|LinkedIn).*',
-            r'Follow us on.*',
-            r'Also Read:.*',
-            r'Related:.*'
-        ]
-        
-        for pattern in unwanted_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        for pattern in _UNWANTED_TEXT:
+            text = pattern.sub('', text)
         
         return text.strip()
     
     def is_relevant_article(self, title, content):
         """Enhanced relevance check for defense/space articles"""
-        text = (title + " " + content).lower()
-        
-        # Higher priority for space content
-        space_priority_keywords = [
-            "isro", "indian space", "space mission", "satellite launch", "rocket",
-            "skyroot", "agnikul", "pixxel", "private space", "space startup",
-            "chandrayaan", "gaganyaan", "mangalyaan", "space policy"
-        ]
+        # Cheap title pre-screen before the full keyword scan
+        if _OFF_TOPIC_TITLE.search(title):
+            return False
         
-        # Check for high-priority space content
-        if any(keyword in text for keyword in space_priority_keywords):
-            return True
-        
-        # Check for defense content
-        defense_priority_keywords = [
-            "hal", "drdo", "defense contract", "indigenous", "atmanirbhar",
-            "tejas", "brahmos", "private defense", "defense startup"
-        ]
+        text = (title + " " + content).lower()
         
-        if any(keyword in text for keyword in defense_priority_keywords):
+        # Any keyword hit makes the article relevant, so stop at the first match
+        for _ in self._keyword_automaton.iter(text):
             return True
-        
-        # General relevance check
-        return any(keyword in text for keyword in self.keywords)
+        return False
     
     def parse_date(self, date_string):
         """Parse various date formats to standard format"""
@@ -222,16 +534,16 @@ class SimpleNewsScraper:
         
         try:
             # Try different date parsing approaches
-            if hasattr(date_string, 'timetuple'):
-                # feedparser date object
+            if isinstance(date_string, str):
+                formatted = _format_date_string(date_string)
+                if formatted:
+                    return formatted
+            elif hasattr(date_string, 'timetuple'):
+                # datetime/date object
                 return datetime(*date_string.timetuple()[:6]).strftime("%d %B %Y")
-            elif isinstance(date_string, str):
-                # Try to parse string date
-                for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S"]:
-                    try:
-                        return datetime.strptime(date_string, fmt).strftime("%d %B %Y")
-                    except ValueError:
-                        continue
+            else:
+                # feedparser *_parsed fields are time.struct_time tuples
+                return datetime(*date_string[:6]).strftime("%d %B %Y")
         except:
             pass
         
@@ -239,7 +551,7 @@ class SimpleNewsScraper:
     
     def add_google_news_search(self, days_back=7):
         """Add Google News search for Indian space developments"""
-        articles = []
+        pending = []
         
         # Specific search terms for Indian space news
         search_terms = [
@@ -251,6 +563,7 @@ class SimpleNewsScraper:
         ]
         
         print("Searching Google News for Indian space developments...")
+        cutoff_ts = (datetime.now() - timedelta(days=days_back)).timestamp()
         
         for term in search_terms[:3]:  # Limit searches to avoid rate limiting
             try:
@@ -258,105 +571,159 @@ class SimpleNewsScraper:
                 encoded_term = term.replace(" ", "+")
                 search_url = f"https://news.google.com/rss/search?q={encoded_term}+india&hl=en-IN&gl=IN&ceid=IN:en"
                 
-                response = self.session.get(search_url, timeout=10)
+                response = self.session.get(search_url, timeout=REQUEST_TIMEOUT, expire_after=FEED_EXPIRE_AFTER)
                 if response.status_code == 200:
-                    feed = feedparser.parse(response.content)
+                    feed = _parse_feed(response.content)
                     
-                    for entry in feed.entries[:2]:  # Top 2 results per search
-                        # Check date
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            pub_date = datetime(*entry.published_parsed[:6])
-                            cutoff_date = datetime.now() - timedelta(days=days_back)
-                            if pub_date < cutoff_date:
-                                continue
-                        
-                        # Check relevance
-                        if self.is_relevant_article(entry.title, entry.get('summary', '')):
-                            print(f"    Found: {entry.title[:60]}...")
-                            
-                            # Extract full content
-                            full_content = self.extract_full_article(entry.link)
-                            
-                            article = {
-                                'title': entry.title,
-                                'url': entry.link,
-                                'content': full_content,
-                                'date': self.parse_date(entry.get('published_parsed')),
-                                'source': 'Google News Search',
-                                'category': 'Space News' if any(kw in entry.title.lower() for kw in self.space_keywords) else 'Defense News'
-                            }
-                            
-                            articles.append(article)
+                    # Top 2 results per search; results are ranked, not dated
+                    for entry in self._relevant_entries(feed, cutoff_ts, 2):
+                        print(f"    Found: {entry.title[:60]}...")
+                        pending.append(entry)
                             
             except Exception as e:
                 print(f"    Error searching for '{term}': {e}")
         
+        # Extract full content for all results concurrently
+        contents = self._extract_articles([entry.link for entry in pending])
+        
+        articles = []
+        for entry, full_content in zip(pending, contents):
+            title_lc = entry.title.lower()
+            is_space = any(kw in title_lc for kw in self._space_keywords)
+            category = 'Space News' if is_space else 'Defense News'
+            articles.append(self._build_article(entry, full_content, 'Google News Search', category))
+        
         return articles
     
     def remove_duplicates(self, articles):
-        """Remove duplicate articles based on title similarity"""
+        """Remove duplicate articles based on URL and title similarity"""
         unique_articles = []
+        seen_urls = set()
         seen_titles = set()
         
         for article in articles:
+            # Same story reposted with tracking parameters or a trailing slash
+            url_key = _canonical_url(article['url'])
+            
             # Simple deduplication based on title
-            title_key = re.sub(r'[^\w\s]', '', article['title'].lower())
-            title_key = ' '.join(title_key.split()[:5])  # First 5 words
+            title_key = _TITLE_PUNCT.sub('', article['title'].lower())
+            title_key = ' '.join(title_key.split(None, 5)[:5])  # First 5 words
             
-            if title_key not in seen_titles:
+            if url_key not in seen_urls and title_key not in seen_titles:
+                seen_urls.add(url_key)
                 seen_titles.add(title_key)
                 unique_articles.append(article)
         
         return unique_articles
     
+    def _extract_articles(self, urls):
+        """Extract full article text for many URLs concurrently, preserving order"""
+        with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as pool:
+            return list(pool.map(self.extract_full_article, urls))
+    
+    def _fetch_and_parse(self, feed_url, category):
+        """Fetch and parse a single RSS feed (runs in a worker thread)"""
+        try:
+            # Stream so uncached error bodies are never downloaded; retries happen in the adapter
+            with self.session.get(feed_url, timeout=REQUEST_TIMEOUT, stream=True,
+                                  expire_after=FEED_EXPIRE_AFTER) as response:
+                if response.status_code != 200:
+                    return category, feed_url, None, None
+                
+                # Feed unchanged since the last run, skip the parse
+                if response.from_cache and feed_url in self._feed_cache:
+                    return category, feed_url, self._feed_cache[feed_url], None
+                
+                # Feeds are cached, so the body is already buffered in full
+                body = response.content
+            feed = _parse_feed(body)
+            self._feed_cache[feed_url] = feed
+            return category, feed_url, feed, None
+        except Exception as e:
+            return category, feed_url, None, e
+    
+    def _build_article(self, entry, content, source, category):
+        """Build the article record for a feed entry and its extracted text"""
+        article = {
+            'title': entry.title,
+            'url': entry.link,
+            'content': content,
+            'date': self.parse_date(entry.get('published_parsed')),
+            'source': source,
+            'category': category
+        }
+        # Lowercased once here so later passes don't copy the body again
+        article['_text_lc'] = (article['title'] + " " + article['content']).lower()
+        return article
+    
+    def _relevant_entries(self, feed, cutoff_ts, limit):
+        """Return the usable, recent and relevant entries among a feed's first few"""
+        entries = []
+        for entry in islice(feed.entries, limit):
+            # Skip unusable entries before anything more expensive
+            title = entry.get('title')
+            if not title or not entry.get('link'):
+                continue
+            
+            # Feeds aren't reliably sorted by publish date (Blogger sorts by update),
+            # so skip stale entries rather than stopping at the first one
+            published = entry.get('published_parsed')
+            if published and time.mktime(published) < cutoff_ts:
+                continue
+            
+            # Enhanced relevance check
+            if self.is_relevant_article(title, entry.get('summary', '')):
+                entries.append(entry)
+        return entries
+    
     def scrape_rss_feeds(self, days_back=7):
         """Scrape all RSS feeds for articles from specified number of days"""
         articles = []
         cutoff_date = datetime.now() - timedelta(days=days_back)
+        cutoff_ts = cutoff_date.timestamp()
         
         print(f"Looking for articles from the last {days_back} days (since {cutoff_date.strftime('%Y-%m-%d')})")
         
-        for category, feeds in self.sources.items():
-            print(f"Scraping {category} sources...")
+        feed_jobs = [(category, feed_url) for category, feeds in self.sources.items() for feed_url in feeds]
+        print(f"Fetching {len(feed_jobs)} feeds...")
+        
+        # Article bodies are queued on a second pool as soon as their feed arrives,
+        # so extraction overlaps with the feeds still downloading
+        results = {}
+        with ThreadPoolExecutor(max_workers=FEED_WORKERS) as feed_pool, \
+                ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as article_pool:
+            futures = [feed_pool.submit(self._fetch_and_parse, feed_url, category)
+                       for category, feed_url in feed_jobs]
+            for future in as_completed(futures):
+                category, feed_url, feed, error = future.result()
+                extractions = []
+                if feed is not None:
+                    try:
+                        for entry in self._relevant_entries(feed, cutoff_ts, 15):
+                            extractions.append(
+                                (entry, article_pool.submit(self.extract_full_article, entry.link))
+                            )
+                    except Exception as e:
+                        error = e
+                results[(category, feed_url)] = (extractions, error)
             
-            for feed_url in feeds:
-                try:
-                    print(f"  - {feed_url}")
-                    response = self.session.get(feed_url, timeout=10)
-                    
-                    if response.status_code == 200:
-                        feed = feedparser.parse(response.content)
-                        
-                        for entry in feed.entries[:15]:  # Check more articles
-                            # Check if article is within specified timeframe
-                            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                                pub_date = datetime(*entry.published_parsed[:6])
-                                if pub_date < cutoff_date:
-                                    continue
-                            
-                            # Enhanced relevance check
-                            if self.is_relevant_article(entry.title, entry.get('summary', '')):
-                                
-                                # Extract full article content
-                                print(f"    Extracting: {entry.title[:50]}...")
-                                full_content = self.extract_full_article(entry.link)
-                                
-                                # Parse publication date
-                                pub_date = self.parse_date(entry.get('published_parsed'))
-                                
-                                article = {
-                                    'title': entry.title,
-                                    'url': entry.link,
-                                    'content': full_content,
-                                    'date': pub_date,
-                                    'source': feed_url,
-                                    'category': category
-                                }
-                                
-                                articles.append(article)
-                                
-                except Exception as e:
-                    print(f"    Error scraping {feed_url}: {e}")
+            # Assemble articles in source order to keep the report stable
+            current_category = None
+            for category, feed_url in feed_jobs:
+                if category != current_category:
+                    current_category = category
+                    print(f"Scraping {category} sources...")
+                
+                extractions, error = results[(category, feed_url)]
+                print(f"  - {feed_url}")
+                if error:
+                    print(f"    Error scraping {feed_url}: {error}")
+                
+                for entry, content_future in extractions:
+                    print(f"    Extracting: {entry.title[:50]}...")
+                    articles.append(
+                        self._build_article(entry, content_future.result(), feed_url, category)
+                    )
         
         # Add Google News search results for space content
         try:
@@ -372,117 +739,80 @@ class SimpleNewsScraper:
     
     def generate_company_summary(self, articles):
         """Generate a summary of companies mentioned across all articles"""
-        
-        # UPDATED - Key companies to track
-        defense_companies = [
-            "HAL", "Hindustan Aeronautics", "DRDO", "BEL", "Bharat Electronics",
-            "BHEL", "Bharat Heavy Electricals", "Tata Advanced Systems",
-            "TASL", "L&T", "Larsen & Toubro", "Mahindra Defense", "Kalyani Group", 
-            "Bharat Forge", "Reliance Defence", "Adani Defence", "Godrej Aerospace",
-            "Bharat Dynamics", "BDL", "Ordnance Factory", "GRSE", "MDL", "CSL",
-            "Alpha Design Technologies", "Dynamatic Technologies", "Zen Technologies",
-            "Solar Industries", "Premier Explosives"
-        ]
-        
-        space_companies = [
-            "ISRO", "Indian Space Research Organisation", "Skyroot", "Skyroot Aerospace",
-            "Agnikul", "Agnikul Cosmos", "Pixxel", "Bellatrix", "Bellatrix Aerospace",
-            "Dhruva Space", "Astrome", "Astrome Technologies", "Antrix", "NSIL",
-            "NewSpace India", "Kawa Space", "Satellogic India", "Momentus India",
-            "Digantara", "GalaxEye", "SatSure", "Spire Global India"
-        ]
-        
         mentioned_defense = set()
         mentioned_space = set()
         
         for article in articles:
-            text = (article['title'] + " " + article['content']).lower()
+            text = article['_text_lc']
             
-            for company in defense_companies:
-                if company.lower() in text:
+            for _, (category, company) in self._company_automaton.iter(text):
+                if category == 'defense':
                     mentioned_defense.add(company)
-            
-            for company in space_companies:
-                if company.lower() in text:
+                else:
                     mentioned_space.add(company)
         
-        summary = "\n## 📊 COMPANIES MENTIONED THIS PERIOD\n\n"
+        parts = ["\n## 📊 COMPANIES MENTIONED THIS PERIOD\n\n"]
         
         if mentioned_defense:
-            summary += f"**Defense Companies:** {', '.join(sorted(mentioned_defense))}\n\n"
+            parts.append(f"**Defense Companies:** {', '.join(sorted(mentioned_defense))}\n\n")
         
         if mentioned_space:
-            summary += f"**Space Companies:** {', '.join(sorted(mentioned_space))}\n\n"
+            parts.append(f"**Space Companies:** {', '.join(sorted(mentioned_space))}\n\n")
         
         if not mentioned_defense and not mentioned_space:
-            summary += "No major defense or space companies specifically mentioned.\n\n"
+            parts.append("No major defense or space companies specifically mentioned.\n\n")
         
-        return summary
+        return "".join(parts)
     
     def generate_simple_report(self, articles, days_back):
         """Generate enhanced markdown report with separate defense and space sections"""
+        return "".join(self.generate_report_parts(articles, days_back))
+    
+    def generate_report_parts(self, articles, days_back):
+        """Generate the markdown report as a list of string chunks"""
         if not articles:
-            return f"No articles found for the last {days_back} days."
+            return [f"No articles found for the last {days_back} days."]
         
         # Separate articles by category
         defense_articles = [a for a in articles if a['category'] == 'Defense News']
         space_articles = [a for a in articles if a['category'] == 'Space News']
         
         period_text = f"last {days_back} day{'s' if days_back != 1 else ''}"
-        report = f"""# Defense & Space News Summary
+        parts = [f"""# Defense & Space News Summary
 ## {period_text.title()} - Generated on {datetime.now().strftime('%B %d, %Y')}
 
 **Total Articles:** {len(articles)} ({len(defense_articles)} Defense, {len(space_articles)} Space)
 
 ---
 
-"""
+"""]
         
         # Defense section
         if defense_articles:
-            report += f"## 🛡️ DEFENSE SECTOR NEWS ({len(defense_articles)} articles)\n\n"
+            parts.append(f"## 🛡️ DEFENSE SECTOR NEWS ({len(defense_articles)} articles)\n\n")
             for i, article in enumerate(defense_articles, 1):
-                report += f"""### {i}. {article['title']}
-
-**Date:** {article['date']}
-**Link:** {article['url']}
-**Source:** {article['source']}
-
-**Full Article Text:**
-{article['content']}
-
----
-
-"""
+                parts.append(_ARTICLE_TEMPLATE.format(i=i, **article))
         
         # Space section
         if space_articles:
-            report += f"## 🚀 SPACE SECTOR NEWS ({len(space_articles)} articles)\n\n"
+            parts.append(f"## 🚀 SPACE SECTOR NEWS ({len(space_articles)} articles)\n\n")
             for i, article in enumerate(space_articles, 1):
-                report += f"""### {i}. {article['title']}
-
-**Date:** {article['date']}
-**Link:** {article['url']}
-**Source:** {article['source']}
-
-**Full Article Text:**
-{article['content']}
-
----
-
-"""
+                parts.append(_ARTICLE_TEMPLATE.format(i=i, **article))
         
         # Add summary of companies mentioned
-        report += self.generate_company_summary(articles)
+        parts.append(self.generate_company_summary(articles))
         
-        return report
+        return parts
     
     def save_report(self, report, days_back=7):
-        """Save report to file"""
+        """Save report (a string or a list of chunks) to file"""
         filename = f"defense_news_{days_back}days_{datetime.now().strftime('%Y%m%d')}.md"
+        if isinstance(report, str):
+            report = [report]
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(report)
+            # Large write buffer so multi-MB reports go out in few syscalls
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.writelines(report)
             print(f"Report saved to: {filename}")
             return filename
         except Exception as e:
@@ -495,6 +825,9 @@ class SimpleNewsScraper:
         print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Looking for articles from the last {days_back} days")
         
+        # Drop responses long past their expiry so the cache file doesn't grow every run
+        self.session.cache.delete(older_than=ARTICLE_EXPIRE_AFTER * 2)
+        
         # Scrape articles
         articles = self.scrape_rss_feeds(days_back)
         
@@ -504,8 +837,8 @@ class SimpleNewsScraper:
         
         print(f"Found {len(articles)} relevant articles")
         
-        # Generate report
-        report = self.generate_simple_report(articles, days_back)
+        # Generate report, kept in chunks so it is never joined into one string
+        report = self.generate_report_parts(articles, days_back)
         
         # Save report
         filename = self.save_report(report, days_back)
@@ -514,9 +847,9 @@ class SimpleNewsScraper:
         if filename:
             print(f"Open {filename} to view the results")
 
-def run_scheduled():
+def run_scheduled(cache_dir=CACHE_DIR):
     """Run scraper on schedule with default 7-day period"""
-    scraper = SimpleNewsScraper()
+    scraper = SimpleNewsScraper(cache_dir)
     
     # Schedule for every Monday at 9 AM
     schedule.every().monday.at("09:00").do(scraper.run_scraper, 7)
@@ -527,7 +860,9 @@ def run_scheduled():
     try:
         while True:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            # Sleep straight through to the next run instead of polling
+            idle = schedule.idle_seconds()
+            time.sleep(max(idle, 0) if idle is not None else 60)
     except KeyboardInterrupt:
         print("\nScheduler stopped")
 
@@ -536,12 +871,13 @@ def main():
     parser.add_argument('--manual', action='store_true', help='Run scraper now (with time selection)')
     parser.add_argument('--schedule', action='store_true', help='Start scheduled scraper (weekly)')
     parser.add_argument('--days', type=int, help='Number of days to look back (1-30)', default=7)
+    parser.add_argument('--cache-dir', help='Directory for the HTTP response cache', default=CACHE_DIR)
     
     args = parser.parse_args()
     
     if args.manual:
         # Create scraper instance
-        scraper = SimpleNewsScraper()
+        scraper = SimpleNewsScraper(args.cache_dir)
         
         if args.days and 1 <= args.days <= 30:
             # Use command line specified days
@@ -551,12 +887,13 @@ def main():
             scraper.run_scraper(7)
             
     elif args.schedule:
-        run_scheduled()
+        run_scheduled(args.cache_dir)
     else:
         print("Usage:")
         print("  python simple_scraper.py --manual              # Run now (7 days default)")
         print("  python simple_scraper.py --manual --days 3     # Run for last 3 days")
         print("  python simple_scraper.py --schedule            # Run weekly")
+        print("  python simple_scraper.py --manual --cache-dir .http_cache  # Custom cache location")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,199 @@
+"""Tests for simple_scraper, run against a local HTTP server"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import feedparser
+import lxml.html
+
+import simple_scraper
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+# path -> (Content-Type, body) served by the test server
+PAGES = {
+    '/utf8-no-meta.html': (
+        'text/html; charset=utf-8',
+        '<html><body><article><p>ISRO’s ₹500 crore — Chandrayaan</p></article></body></html>'.encode('utf-8')
+    ),
+    '/meta-only.html': (
+        'text/html',
+        '<html><head><meta charset="utf-8"></head><body><article><p>Gaganyaan — crew module</p></article></body></html>'.encode('utf-8')
+    ),
+    '/script-inline.html': (
+        'text/html; charset=utf-8',
+        b'<html><body><article><p>ISRO said<script>track()</script>the launch slipped</p></article></body></html>'
+    ),
+    '/ad-inline.html': (
+        'text/html; charset=utf-8',
+        b'<html><body><article><p>Budget<span class="ad">Buy now</span>rises</p></article></body></html>'
+    ),
+    '/report.pdf': ('application/pdf', b'%PDF-1.4 ' + b'x' * 100000),
+}
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in PAGES:
+            self.send_error(404)
+            return
+        content_type, body = PAGES[self.path]
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+class ScraperTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.scraper = simple_scraper.SimpleNewsScraper(self.cache_dir.name)
+
+    def tearDown(self):
+        self.scraper.session.close()
+        self.cache_dir.cleanup()
+
+class ExtractEncodingTest(ScraperTestCase):
+    def test_header_charset_without_meta(self):
+        content = self.scraper.extract_full_article(self.base_url + '/utf8-no-meta.html')
+        self.assertEqual(content, 'ISRO’s ₹500 crore — Chandrayaan')
+
+    def test_meta_charset_without_header_charset(self):
+        content = self.scraper.extract_full_article(self.base_url + '/meta-only.html')
+        self.assertEqual(content, 'Gaganyaan — crew module')
+
+class ExtractTextTest(ScraperTestCase):
+    def test_removed_script_keeps_words_apart(self):
+        content = self.scraper.extract_full_article(self.base_url + '/script-inline.html')
+        self.assertEqual(content, 'ISRO said\nthe launch slipped')
+
+    def test_removed_ad_keeps_words_apart(self):
+        content = self.scraper.extract_full_article(self.base_url + '/ad-inline.html')
+        self.assertEqual(content, 'Budget\nrises')
+
+class ExtractCacheTest(ScraperTestCase):
+    def test_non_html_is_rejected_and_not_cached(self):
+        url = self.base_url + '/report.pdf'
+        content = self.scraper.extract_full_article(url)
+        self.assertEqual(content, 'Article is not an HTML page (application/pdf)')
+        self.assertFalse(self.scraper.session.cache.contains(url=url))
+
+    def test_html_is_cached(self):
+        url = self.base_url + '/meta-only.html'
+        self.scraper.extract_full_article(url)
+        self.assertTrue(self.scraper.session.cache.contains(url=url))
+
+class CleanTextTest(ScraperTestCase):
+    def test_share_pattern_does_not_reach_past_earlier_cut(self):
+        self.assertEqual(self.scraper.clean_text('Market share rose; Read more on LinkedIn'),
+                         'Market share rose;')
+        self.assertEqual(self.scraper.clean_text('ISRO shares data. Subscribe to Twitter updates'),
+                         'ISRO shares data.')
+
+    def test_share_links_are_removed(self):
+        self.assertEqual(self.scraper.clean_text('Launch done.\nShare this on Facebook and more'),
+                         'Launch done.')
+
+def _plain_text(markup):
+    return lxml.html.fromstring(f"<div>{markup}</div>").text_content()
+
+class FeedParserTest(unittest.TestCase):
+    """The lxml feed parser must agree with feedparser on the fields the scraper reads"""
+
+    def _compare(self, name):
+        with open(os.path.join(DATA_DIR, name), 'rb') as f:
+            body = f.read()
+        ours = simple_scraper._parse_feed_lxml(body)
+        reference = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False)
+        self.assertIsNotNone(ours)
+        self.assertEqual(len(ours.entries), len(reference.entries))
+        for entry, expected in zip(ours.entries, reference.entries):
+            # feedparser keeps Atom xhtml titles as markup; the scraper wants the text
+            self.assertEqual(entry.title, _plain_text(expected.title))
+            self.assertEqual(entry.link, expected.link)
+            self.assertEqual(entry.summary, expected.summary)
+            # feedparser files dc:date under updated_parsed
+            self.assertEqual(entry.published_parsed,
+                             expected.get('published_parsed') or expected.get('updated_parsed'))
+        return ours
+
+    def test_rss2(self):
+        feed = self._compare('rss2.xml')
+        # <media:title>, <itunes:summary> and <media:content> must not shadow the real fields
+        self.assertEqual(feed.entries[0].title, 'HAL delivers Tejas Mk1A to IAF')
+
+    def test_atom_blogger(self):
+        feed = self._compare('atom_blogger.xml')
+        self.assertEqual(feed.entries[1].title, 'Agnikul launch update')
+
+    def test_rss1_rdf(self):
+        self._compare('rss1_rdf.xml')
+
+    def test_rss2_content_encoded_as_summary(self):
+        feed = self._compare('rss2_content_encoded.xml')
+        self.assertIn('Skyroot Aerospace', feed.entries[0].summary)
+
+    def test_atom_xml_base_resolves_relative_links(self):
+        feed = self._compare('atom_xml_base.xml')
+        self.assertEqual([e.link for e in feed.entries], ['http://x/post/5', 'http://y/post/6'])
+
+    def test_malformed_feed_falls_back_to_feedparser(self):
+        body = (b'<?xml version="1.0"?><rss version="2.0"><channel><item>'
+                b'<title>Bad &nbsp; entity</title><link>http://x/e</link></item></channel></rss>')
+        feed = simple_scraper._parse_feed(body)
+        self.assertEqual(feed.entries[0].title, 'Bad \xa0 entity')
+
+class RelevantEntriesTest(ScraperTestCase):
+    def test_stale_entry_does_not_hide_newer_ones(self):
+        # Blogger feeds sort by update time, so an edited old post can come first
+        now = time.time()
+        feed = simple_scraper._FeedDict(entries=[
+            simple_scraper._FeedDict(title='Old ISRO post, edited', link='https://a/old',
+                                     summary='', published_parsed=time.localtime(now - 30 * 86400)),
+            simple_scraper._FeedDict(title='New ISRO launch', link='https://a/new',
+                                     summary='', published_parsed=time.localtime(now - 86400)),
+        ])
+        entries = self.scraper._relevant_entries(feed, now - 7 * 86400, 15)
+        self.assertEqual([e.link for e in entries], ['https://a/new'])
+
+class ParseDateTest(ScraperTestCase):
+    def test_formats_published_parsed_from_both_parsers(self):
+        with open(os.path.join(DATA_DIR, 'rss2.xml'), 'rb') as f:
+            body = f.read()
+        reference = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False)
+        ours = simple_scraper._parse_feed_lxml(body)
+        # pubDate "Thu, 15 Oct 2026 02:52:48 +0530" is 14 October in UTC
+        self.assertEqual(self.scraper.parse_date(reference.entries[0].published_parsed), '14 October 2026')
+        self.assertEqual(self.scraper.parse_date(ours.entries[0].published_parsed), '14 October 2026')
+        self.assertEqual(self.scraper.parse_date(ours.entries[1].published_parsed), '14 October 2026')
+
+class LRUCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = simple_scraper._LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+if __name__ == '__main__':
+    unittest.main()